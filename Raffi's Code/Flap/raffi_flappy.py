@@ -5,7 +5,7 @@ Raffi Flappy — a clean, production-quality Flappy Bird clone using pygame.
 Requirements
 ------------
 - Python 3.8+
-- pygame (`pip install pygame`)
+- pygame-ce (`pip install pygame-ce`)
 
 Run
 ---
@@ -16,14 +16,16 @@ Notes
 - No external assets are used; everything is drawn with pygame primitives.
 - The bird is named "Raffi" (see window title and code).
 - Game features: start screen, gameplay, game over screen, restart, scoring,
-  difficulty scaling, smooth physics, 60 FPS.
+  difficulty scaling, fixed-step 120 Hz physics, 60 FPS rendering.
 """
 
 import math
+import os
 import random
 import sys
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Deque, Dict, List, Tuple
 
 import pygame
 
@@ -32,9 +34,12 @@ import pygame
 # -------------------------------
 
 WIDTH, HEIGHT = 432, 768        # Classic tall canvas (mobile-like)
-FPS = 60
+FPS = 60                        # render cap
+PHYSICS_DT = 1.0 / 120          # fixed simulation step (s), independent of the render rate
+MAX_FRAME_DT = 0.25             # clamp long frames so physics can't spiral trying to catch up
 
 GROUND_H = 96                   # Height of the ground strip
+GROUND_TILE_W = 36              # Width of one ground pattern tile
 PLAY_AREA_H = HEIGHT - GROUND_H
 
 GRAVITY = 1500.0                # px / s^2
@@ -50,21 +55,34 @@ DIFFICULTY_TIME_TO_MAX = 90.0   # seconds to reach near max difficulty
 
 BIRD_X = WIDTH // 4
 BIRD_RADIUS = 18
-
-# Colors
-SKY = (135, 206, 235)
-GROUND = (224, 200, 145)
-PIPE_GREEN = (0, 160, 75)
-PIPE_DARK = (0, 120, 60)
+BIRD_WING_FRAMES = 8            # wing animation steps cached per rotation degree
+
+# Colors (pygame.Color so draw calls skip tuple conversion; text colors stay
+# tuples because they are part of the hashable text-cache key)
+SKY = pygame.Color(135, 206, 235)
+GROUND = pygame.Color(224, 200, 145)
+GROUND_TILE = pygame.Color(210, 190, 135)
+PIPE_GREEN = pygame.Color(0, 160, 75)
+PIPE_DARK = pygame.Color(0, 120, 60)
 WHITE = (250, 250, 250)
 BLACK = (20, 20, 20)
-YELLOW = (255, 220, 85)
-ORANGE = (255, 170, 50)
-RED = (220, 50, 60)
-SHADOW = (0, 0, 0, 64)
+YELLOW = pygame.Color(255, 220, 85)
+ORANGE = pygame.Color(255, 170, 50)
+BEAK = pygame.Color(255, 150, 0)
+BIRD_SHADOW = pygame.Color(0, 0, 0)
+RED = pygame.Color(220, 50, 60)
+SHADOW = pygame.Color(0, 0, 0, 64)
+
+# pygame-ce provides a native Circle with C-level collision tests (in pygame.geometry)
+try:
+    from pygame.geometry import Circle
+except ImportError:
+    Circle = None
+HAS_CIRCLE = Circle is not None and hasattr(Circle, "collidelist")
 
 
 def clamp(v: float, lo: float, hi: float) -> float:
+    """Convenience for non-hot code; per-step paths inline max(lo, min(hi, v)) instead."""
     return max(lo, min(hi, v))
 
 
@@ -73,18 +91,33 @@ def ease_out_quint(t: float) -> float:
     return 1 - pow(1 - t, 5)
 
 
-def circle_rect_collision(cx: float, cy: float, cr: float, rx: float, ry: float, rw: float, rh: float) -> bool:
+def make_pipe_surface(lip_at_bottom: bool) -> pygame.Surface:
     """
-    Accurate circle-rectangle collision.
-    (cx, cy) circle center; radius cr.
-    Rect at (rx, ry) with size (rw, rh).
+    Pre-render a full-height pipe column with its lip; PipePair.draw crops it per frame.
+    lip_at_bottom: True for the top pipe (lip at its lower end), False for the bottom pipe.
     """
-    # Find the closest point on the rectangle to the circle center
-    closest_x = clamp(cx, rx, rx + rw)
-    closest_y = clamp(cy, ry, ry + rh)
-    dx = cx - closest_x
-    dy = cy - closest_y
-    return (dx * dx + dy * dy) <= (cr * cr)
+    surf = pygame.Surface((PIPE_WIDTH + 12, PLAY_AREA_H), pygame.SRCALPHA)
+    pygame.draw.rect(surf, PIPE_GREEN, (6, 0, PIPE_WIDTH, PLAY_AREA_H))
+    lip_y = PLAY_AREA_H - 20 if lip_at_bottom else 0
+    pygame.draw.rect(surf, PIPE_DARK, (0, lip_y, PIPE_WIDTH + 12, 20))
+    return surf
+
+
+PIPE_TOP_SURF = make_pipe_surface(lip_at_bottom=True)
+PIPE_BOT_SURF = make_pipe_surface(lip_at_bottom=False)
+
+
+def make_ground_strip() -> pygame.Surface:
+    """Pre-render the ground and its alternating tile pattern, twice the screen wide."""
+    strip = pygame.Surface((2 * WIDTH, GROUND_H))
+    strip.fill(GROUND)
+    for i in range(2 * WIDTH // GROUND_TILE_W):
+        h = 18 if i % 2 == 0 else 10
+        pygame.draw.rect(strip, GROUND_TILE, (i * GROUND_TILE_W, 0, GROUND_TILE_W, h))
+    return strip
+
+
+GROUND_STRIP_SURF = make_ground_strip()
 
 
 @dataclass
@@ -101,32 +134,34 @@ class PipePair:
     width: int = PIPE_WIDTH
     passed: bool = False  # Whether bird has scored for this pair
 
-    @property
-    def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
+    def __post_init__(self) -> None:
+        # The gap never changes, so both rects are built once and only slid along x
         top_h = max(0, int(self.gap_y - self.gap_h / 2))
         bot_y = int(self.gap_y + self.gap_h / 2)
         bot_h = max(0, PLAY_AREA_H - bot_y)
-        top = pygame.Rect(int(self.x), 0, self.width, top_h)
-        bottom = pygame.Rect(int(self.x), bot_y, self.width, bot_h)
-        return top, bottom
+        self._top = pygame.Rect(int(self.x), 0, self.width, top_h)
+        self._bot = pygame.Rect(int(self.x), bot_y, self.width, bot_h)
+
+    @property
+    def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
+        return self._top, self._bot
 
     def update(self, dt: float, speed: float) -> None:
         self.x -= speed * dt
+        self._top.x = self._bot.x = int(self.x)
 
     def is_offscreen(self) -> bool:
         return self.x + self.width < 0
 
-    def draw(self, surf: pygame.Surface) -> None:
-        top, bottom = self.rects
-        # Draw pipes with a lip for a nicer look
-        for r in (top, bottom):
-            pygame.draw.rect(surf, PIPE_GREEN, r)
-            lip = pygame.Rect(r.left - 6, r.top, r.width + 12, 20)
-            if r.top > 0:  # bottom pipe
-                lip.top = r.top
-            else:          # top pipe: draw lip at bottom end
-                lip.top = r.bottom - 20
-            pygame.draw.rect(surf, PIPE_DARK, lip)
+    def draw(self, surf: pygame.Surface) -> Tuple[pygame.Rect, pygame.Rect]:
+        """Blit both pipes; returns the screen areas drawn."""
+        blit = surf.blit
+        top, bottom = self._top, self._bot
+        x, w = top.x - 6, self.width + 12
+        top_h, bot_h = top.height, bottom.height
+        # Crop the pre-rendered columns so each lip ends up at the gap edge
+        return (blit(PIPE_TOP_SURF, (x, 0), (0, PLAY_AREA_H - top_h, w, top_h)),
+                blit(PIPE_BOT_SURF, (x, bottom.y), (0, 0, w, bot_h)))
 
 
 class Bird:
@@ -140,6 +175,10 @@ class Bird:
         self.alive = True
         self.wing_phase = 0.0    # 0..1 loop for wing flapping animation
         self.rot = 0.0           # visual rotation for tilt
+        # Pre-rendered sprites keyed by (rotation degree, wing frame), filled lazily
+        self._sprite_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Collision shape kept in sync with (x, y) while alive (pygame-ce only)
+        self._circle = Circle(self.x, self.y, self.r) if HAS_CIRCLE else None
 
     def reset(self, y: int) -> None:
         self.y = float(y)
@@ -153,25 +192,32 @@ class Bird:
         self.vy = FLAP_IMPULSE
 
     def update(self, dt: float) -> None:
+        # Called every physics step: work on locals, write attributes back once
+        # (clamps are inlined as max(lo, min(hi, v)) to skip the helper call)
+
+        # Gravity applies whether alive or not (bird falls even after death)
+        vy = max(-9999, min(MAX_FALL_SPEED, self.vy + GRAVITY * dt))
+        y = self.y + vy * dt
+        self.vy = vy
+        self.y = y
+
         if not self.alive:
-            # Bird falls even after death
-            self.vy = clamp(self.vy + GRAVITY * dt, -9999, MAX_FALL_SPEED)
-            self.y += self.vy * dt
-            self.rot = clamp(self.rot + 240 * dt, -30, 70)
+            self.rot = max(-30, min(70, self.rot + 240 * dt))
             self.wing_phase = (self.wing_phase + 2.0 * dt) % 1.0
             return
 
-        # Alive physics
-        self.vy = clamp(self.vy + GRAVITY * dt, -9999, MAX_FALL_SPEED)
-        self.y += self.vy * dt
+        circle = self._circle
+        if circle is not None:
+            circle.y = y
 
         # Visual rotation based on vertical speed
-        target_rot = clamp(self.vy * 0.10, -35, 70)
+        target_rot = max(-35, min(70, vy * 0.10))
         # Smooth rotate
-        self.rot += (target_rot - self.rot) * clamp(dt * 8.0, 0.0, 1.0)
+        rot = self.rot
+        self.rot = rot + (target_rot - rot) * max(0.0, min(1.0, dt * 8.0))
 
         # Wing flapping speed varies with vertical motion
-        flap_speed = 4.0 if self.vy < -50 else 2.6
+        flap_speed = 4.0 if vy < -50 else 2.6
         self.wing_phase = (self.wing_phase + flap_speed * dt) % 1.0
 
     @property
@@ -182,57 +228,98 @@ class Bird:
         return self.x, self.y, self.r
 
     def collides_with_rect(self, rect: pygame.Rect) -> bool:
-        cx, cy, cr = self.circle()
-        return circle_rect_collision(cx, cy, cr, rect.left, rect.top, rect.width, rect.height)
+        if self._circle is not None:
+            return self._circle.colliderect(rect)
+        # Accurate circle-rectangle test: distance from the centre to the closest point on the rect
+        cx, cy, cr = self.x, self.y, self.r
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+        dx = cx - (left if cx < left else right if cx > right else cx)
+        dy = cy - (top if cy < top else bottom if cy > bottom else cy)
+        return (dx * dx + dy * dy) <= (cr * cr)
+
+    def collides_with_any(self, rects: List[pygame.Rect]) -> bool:
+        """True if the bird touches any rect; a single C call on pygame-ce."""
+        if self._circle is not None:
+            return self._circle.collidelist(rects) != -1
+        return any(self.collides_with_rect(r) for r in rects)
+
+    def render_sprite(self, rot: int, wing_frame: int) -> pygame.Surface:
+        """
+        Draw the full bird onto a transparent (4r x 4r) sprite centred at (2r, 2r).
+        rot: tilt in whole degrees
+        wing_frame: wing animation step in 0..BIRD_WING_FRAMES-1
+        """
+        sprite = pygame.Surface((4 * self.r, 4 * self.r), pygame.SRCALPHA).convert_alpha()
+        x = y = 2 * self.r
 
-    def draw(self, surf: pygame.Surface) -> None:
         # Shadow for depth
-        shadow_y = self.y + 4
-        pygame.draw.circle(surf, (0, 0, 0), (int(self.x + 2), int(shadow_y)), self.r)
+        pygame.draw.circle(sprite, BIRD_SHADOW, (x + 2, y + 4), self.r)
 
         # Body (gradient-ish with two tones)
-        pygame.draw.circle(surf, ORANGE, self.pos, self.r)
-        pygame.draw.circle(surf, YELLOW, (self.pos[0] - 4, self.pos[1] - 4), int(self.r * 0.78))
+        pygame.draw.circle(sprite, ORANGE, (x, y), self.r)
+        pygame.draw.circle(sprite, YELLOW, (x - 4, y - 4), int(self.r * 0.78))
 
         # Eye
         eye_r = max(2, int(self.r * 0.15))
-        eye_x = int(self.x + self.r * 0.3)
-        eye_y = int(self.y - self.r * 0.2)
-        pygame.draw.circle(surf, WHITE, (eye_x, eye_y), eye_r + 1)
-        pygame.draw.circle(surf, BLACK, (eye_x, eye_y), eye_r)
+        eye_x = int(x + self.r * 0.3)
+        eye_y = int(y - self.r * 0.2)
+        pygame.draw.circle(sprite, WHITE, (eye_x, eye_y), eye_r + 1)
+        pygame.draw.circle(sprite, BLACK, (eye_x, eye_y), eye_r)
 
         # Beak (triangle)
         beak_len = int(self.r * 0.9)
         beak_h = int(self.r * 0.5)
-        angle_rad = math.radians(self.rot)
+        angle_rad = math.radians(rot)
         # Beak points to the right; tilt with rotation
-        tip = (int(self.x + math.cos(angle_rad) * (self.r + beak_len)),
-               int(self.y + math.sin(angle_rad) * (self.r + beak_len)))
-        base1 = (int(self.x + math.cos(angle_rad + math.pi / 2) * beak_h),
-                 int(self.y + math.sin(angle_rad + math.pi / 2) * beak_h))
-        base2 = (int(self.x + math.cos(angle_rad - math.pi / 2) * beak_h),
-                 int(self.y + math.sin(angle_rad - math.pi / 2) * beak_h))
-        pygame.draw.polygon(surf, (255, 150, 0), [base1, base2, tip])
+        tip = (int(x + math.cos(angle_rad) * (self.r + beak_len)),
+               int(y + math.sin(angle_rad) * (self.r + beak_len)))
+        base1 = (int(x + math.cos(angle_rad + math.pi / 2) * beak_h),
+                 int(y + math.sin(angle_rad + math.pi / 2) * beak_h))
+        base2 = (int(x + math.cos(angle_rad - math.pi / 2) * beak_h),
+                 int(y + math.sin(angle_rad - math.pi / 2) * beak_h))
+        pygame.draw.polygon(sprite, BEAK, [base1, base2, tip])
 
         # Wing (ellipse) with simple flap animation: phase 0..1 maps to offset
-        flap = math.sin(self.wing_phase * 2 * math.pi)  # -1..1
+        flap = math.sin(wing_frame / BIRD_WING_FRAMES * 2 * math.pi)  # -1..1
         wing_offset_y = int(-flap * self.r * 0.45)
         wing_rect = pygame.Rect(0, 0, int(self.r * 1.2), int(self.r * 0.7))
-        wing_rect.center = (int(self.x - self.r * 0.5), int(self.y + wing_offset_y))
-        pygame.draw.ellipse(surf, ORANGE, wing_rect)
+        wing_rect.center = (int(x - self.r * 0.5), int(y + wing_offset_y))
+        pygame.draw.ellipse(sprite, ORANGE, wing_rect)
+        return sprite
+
+    def draw(self, surf: pygame.Surface) -> pygame.Rect:
+        """Blit the cached sprite for the current pose; returns the screen area drawn."""
+        key = (int(self.rot), int(self.wing_phase * BIRD_WING_FRAMES) % BIRD_WING_FRAMES)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = self._sprite_cache[key] = self.render_sprite(*key)
+        return surf.blit(sprite, (int(self.x) - 2 * self.r, int(self.y) - 2 * self.r))
 
 
 class Game:
     """Main game class orchestrating states, input, updates, drawing, and difficulty scaling."""
 
     def __init__(self) -> None:
+        # Let SDL coalesce consecutive draw calls (must be set before init)
+        os.environ.setdefault("SDL_RENDER_BATCHING", "1")
         pygame.init()
         pygame.display.set_caption("Raffi — Flappy Bird")
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
+        self._acc = 0.0                # unsimulated time carried between frames
         self.font_big = pygame.font.SysFont("arialrounded", 48)
         self.font = pygame.font.SysFont("arialrounded", 28)
         self.font_small = pygame.font.SysFont("arialrounded", 20)
+        # Rendered text keyed by (font id, text, color); UI strings rarely change between frames
+        self._text_cache: Dict[Tuple[int, str, Tuple[int, ...]], pygame.Surface] = {}
+
+        # Dirty-rect rendering: only areas drawn this frame or last frame are pushed to the display
+        self.background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.background.fill(SKY)
+        self._dirty: List[pygame.Rect] = []    # areas drawn last frame (erased before redrawing)
+        self._drawn: List[pygame.Rect] = []    # areas drawn so far this frame
+        self._full_redraw = True                # push the whole window next frame (start, expose, restore)
+        self.screen.blit(self.background, (0, 0))
 
         # Game state
         self.reset_all()
@@ -245,7 +332,9 @@ class Game:
         self.score = 0
         self.best_score = 0
         self.bird = Bird(BIRD_X, HEIGHT // 2, BIRD_RADIUS)
-        self.pipes: List[PipePair] = []
+        self.pipes: Deque[PipePair] = deque()     # ordered by x, oldest (leftmost) first
+        self._all_rects: List[pygame.Rect] = []    # top & bottom rects of every pipe, in order
+        self._pending_score: Deque[PipePair] = deque()    # pipes the bird hasn't passed yet, in order
         self.spawn_t = 0.0             # time since last spawn
         self.scroll_x = 0.0            # for ground parallax
 
@@ -257,6 +346,8 @@ class Game:
         self.score = 0
         self.bird.reset(HEIGHT // 2)
         self.pipes.clear()
+        self._all_rects.clear()
+        self._pending_score.clear()
         self.spawn_t = 0.0
         self.elapsed_run_time = 0.0
 
@@ -269,7 +360,7 @@ class Game:
 
     def difficulty_factor(self) -> float:
         """0.0 at start of a run, approaching 1.0 by DIFFICULTY_TIME_TO_MAX seconds."""
-        t = clamp(self.elapsed_run_time / DIFFICULTY_TIME_TO_MAX, 0.0, 1.0)
+        t = max(0.0, min(1.0, self.elapsed_run_time / DIFFICULTY_TIME_TO_MAX))
         return ease_out_quint(t)
 
     def current_pipe_speed(self) -> float:
@@ -288,10 +379,14 @@ class Game:
 
     def run(self) -> None:
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
-            self.time += dt
+            frame_dt = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_DT)
+            self.time += frame_dt
             self.handle_events()
-            self.update(dt)
+            # Step physics in fixed increments; leftover time carries to the next frame
+            self._acc += frame_dt
+            while self._acc >= PHYSICS_DT:
+                self.update(PHYSICS_DT)
+                self._acc -= PHYSICS_DT
             self.draw()
 
     # --------------- Event Handling ---------------
@@ -328,6 +423,10 @@ class Game:
                     self.start_run()
                     self.bird.flap()
 
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                # The window's contents may have been lost; dirty rects alone won't repaint the sky
+                self._full_redraw = True
+
     # --------------- Update ---------------
 
     def update(self, dt: float) -> None:
@@ -339,8 +438,14 @@ class Game:
             return
 
         if self.state == "play":
+            # Called every physics step: bind the hot attributes to locals
+            bird = self.bird
+            pipes = self.pipes
+            all_rects = self._all_rects
+            pending = self._pending_score
+
             self.elapsed_run_time += dt
-            self.bird.update(dt)
+            bird.update(dt)
             speed = self.current_pipe_speed()
 
             # Spawn pipes
@@ -350,28 +455,29 @@ class Game:
                 gap_h = self.current_gap_height()
                 margin = 60
                 gap_center = random.uniform(margin + gap_h / 2, PLAY_AREA_H - margin - gap_h / 2)
-                self.pipes.append(PipePair(WIDTH + 20, gap_center, gap_h))
+                pipe = PipePair(WIDTH + 20, gap_center, gap_h)
+                pipes.append(pipe)
+                all_rects.extend(pipe.rects)
+                pending.append(pipe)
 
             # Update pipes
-            for p in self.pipes:
+            for p in pipes:
                 p.update(dt, speed)
 
-            # Remove offscreen
-            self.pipes = [p for p in self.pipes if not p.is_offscreen()]
+            # Remove offscreen (only the leftmost pipe can have left the screen)
+            while pipes and pipes[0].is_offscreen():
+                pipes.popleft()
+                del all_rects[:2]
 
-            # Scoring & collision
-            bird_cx, bird_cy, bird_r = self.bird.circle()
-            for p in self.pipes:
-                top, bot = p.rects
+            # Scoring: pipes pass the bird in spawn order, so only the oldest pending one can score
+            bird_cx, bird_cy, bird_r = bird.x, bird.y, bird.r
+            while pending and pending[0].x + pending[0].width < bird_cx:
+                pending.popleft().passed = True
+                self.score += 1
 
-                # Score when center of pipe passes bird
-                if not p.passed and p.x + p.width < self.bird.x:
-                    p.passed = True
-                    self.score += 1
-
-                # Collision with pipes
-                if self.bird.collides_with_rect(top) or self.bird.collides_with_rect(bot):
-                    self.end_run()
+            # Collision with pipes (one batched test over every pipe rect)
+            if bird.collides_with_any(all_rects):
+                self.end_run()
 
             # Collision with boundaries (ceiling/ground)
             if bird_cy - bird_r <= 0:
@@ -388,82 +494,92 @@ class Game:
 
     # --------------- Draw Helpers ---------------
 
+    def render_text(self, font: pygame.font.Font, text: str, color: Tuple[int, ...]) -> pygame.Surface:
+        """Antialiased font.render, memoized so unchanged text is not re-rasterized every frame."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
+
+    def blit(self, surf: pygame.Surface, dest) -> None:
+        """Blit onto the screen and record the area for this frame's display update."""
+        self._drawn.append(self.screen.blit(surf, dest))
+
     def draw_background(self) -> None:
-        self.screen.fill(SKY)
+        # Restore the sky only where something was drawn last frame
+        screen, background = self.screen, self.background
+        for rect in self._dirty:
+            screen.blit(background, rect, rect)
 
     def draw_ground(self) -> None:
-        # Simple parallax ground with repeating rectangles
-        ground_y = PLAY_AREA_H
-        pygame.draw.rect(self.screen, GROUND, (0, ground_y, WIDTH, GROUND_H))
-
-        tile_w = 36
-        for i in range(-1, WIDTH // tile_w + 2):
-            x = int(i * tile_w - (self.scroll_x % tile_w))
-            h = 18 if i % 2 == 0 else 10
-            pygame.draw.rect(self.screen, (210, 190, 135), (x, ground_y, tile_w, h))
+        # Simple parallax ground: slide the pre-rendered strip (pattern repeats every two tiles)
+        offset = int(self.scroll_x) % (2 * GROUND_TILE_W)
+        self.blit(GROUND_STRIP_SURF, (-offset, PLAY_AREA_H))
 
     def draw_score(self, center: bool = False) -> None:
-        txt = self.font_big.render(str(self.score), True, WHITE)
+        txt = self.render_text(self.font_big, str(self.score), WHITE)
         if center:
             rect = txt.get_rect(center=(WIDTH // 2, 100))
         else:
             rect = txt.get_rect(midtop=(WIDTH // 2, 32))
         # Shadow
-        shadow = self.font_big.render(str(self.score), True, BLACK)
+        shadow = self.render_text(self.font_big, str(self.score), BLACK)
         shadow_rect = shadow.get_rect(center=rect.center)
         shadow_rect.move_ip(2, 2)
-        self.screen.blit(shadow, shadow_rect)
-        self.screen.blit(txt, rect)
+        self.blit(shadow, shadow_rect)
+        self.blit(txt, rect)
 
     def draw_start_screen(self) -> None:
         # Title with gentle rise animation
         t = clamp((math.sin(self.time * 1.2) + 1) / 2, 0, 1)
         ease = ease_out_quint(t)
-        title = self.font_big.render("Raffi — Flappy Bird", True, WHITE)
+        title = self.render_text(self.font_big, "Raffi — Flappy Bird", WHITE)
         rect = title.get_rect(center=(WIDTH // 2, HEIGHT // 4 - int(12 * (ease - 0.5))))
         # Shadow
-        shadow = self.font_big.render("Raffi — Flappy Bird", True, BLACK)
+        shadow = self.render_text(self.font_big, "Raffi — Flappy Bird", BLACK)
         shadow_rect = shadow.get_rect(center=rect.center)
         shadow_rect.move_ip(3, 3)
-        self.screen.blit(shadow, shadow_rect)
-        self.screen.blit(title, rect)
+        self.blit(shadow, shadow_rect)
+        self.blit(title, rect)
 
-        prompt = self.font.render("Press SPACE / Click to start", True, WHITE)
+        prompt = self.render_text(self.font, "Press SPACE / Click to start", WHITE)
         p_rect = prompt.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 80))
-        self.screen.blit(prompt, p_rect)
+        self.blit(prompt, p_rect)
 
-        hint = self.font_small.render("Flap: Space • Click • W/Up", True, WHITE)
+        hint = self.render_text(self.font_small, "Flap: Space • Click • W/Up", WHITE)
         h_rect = hint.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 120))
-        self.screen.blit(hint, h_rect)
+        self.blit(hint, h_rect)
 
     def draw_gameover_screen(self) -> None:
-        over = self.font_big.render("Game Over", True, WHITE)
+        over = self.render_text(self.font_big, "Game Over", WHITE)
         o_rect = over.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
-        shadow = self.font_big.render("Game Over", True, BLACK)
+        shadow = self.render_text(self.font_big, "Game Over", BLACK)
         s_rect = shadow.get_rect(center=o_rect.center)
         s_rect.move_ip(3, 3)
-        self.screen.blit(shadow, s_rect)
-        self.screen.blit(over, o_rect)
+        self.blit(shadow, s_rect)
+        self.blit(over, o_rect)
 
-        score_txt = self.font.render(f"Score: {self.score}   Best: {self.best_score}", True, WHITE)
+        score_txt = self.render_text(self.font, f"Score: {self.score}   Best: {self.best_score}", WHITE)
         st_rect = score_txt.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 10))
-        self.screen.blit(score_txt, st_rect)
+        self.blit(score_txt, st_rect)
 
-        prompt = self.font_small.render("Press SPACE / R to retry", True, WHITE)
+        prompt = self.render_text(self.font_small, "Press SPACE / R to retry", WHITE)
         p_rect = prompt.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 48))
-        self.screen.blit(prompt, p_rect)
+        self.blit(prompt, p_rect)
 
     # --------------- Draw ---------------
 
     def draw(self) -> None:
         self.draw_background()
+        self._drawn = drawn = []
 
         # Pipes
         for p in self.pipes:
-            p.draw(self.screen)
+            drawn.extend(p.draw(self.screen))
 
         # Bird
-        self.bird.draw(self.screen)
+        drawn.append(self.bird.draw(self.screen))
 
         # Ground on top
         self.draw_ground()
@@ -477,7 +593,13 @@ class Game:
             self.draw_score(center=False)
             self.draw_gameover_screen()
 
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            # Push what was erased (last frame's sprites) and what was drawn this frame
+            pygame.display.update(self._dirty + drawn)
+        self._dirty = drawn
 
 
 def main() -> None:
@@ -1,10 +1,13 @@
 import pygame
+import math
 import random
 import sys
 import numpy as np
 import os
 
-# Initialize Pygame
+# Initialize Pygame (pygame-ce: `pip install pygame-ce`)
+# Let SDL coalesce consecutive draw calls (must be set before init)
+os.environ.setdefault("SDL_RENDER_BATCHING", "1")
 pygame.init()
 pygame.mixer.init()
 
@@ -15,6 +18,9 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
 pygame.display.set_caption("Last Night at Raffi's")
 
 clock = pygame.time.Clock()
+FPS = 30                # render cap
+TICK_DT = 1 / 30        # fixed simulation step; speeds and timers below are per tick
+MAX_FRAME_DT = 0.25     # clamp long frames so the simulation can't spiral catching up
 font = pygame.font.SysFont("courier", 40, bold=True)
 
 # Colors
@@ -23,6 +29,34 @@ BLACK = (0, 0, 0)
 PLAYER_COLOR = (200, 200, 255)
 ENEMY_COLOR = (50, 0, 0)
 
+# Batched random ints: NumPy fills a chunk at a time, the game loop consumes them one by one
+# (much cheaper than random.randint; plain random.random() is already a fast C call)
+rng = np.random.default_rng()
+RAND_BATCH = 4096
+
+def random_ints(lo, hi):
+    # Inclusive range, like random.randint
+    while True:
+        yield from rng.integers(lo, hi + 1, RAND_BATCH).tolist()
+
+# Pre-generated VHS static: one noise surface slightly larger than the screen, blitted at a
+# random offset each frame, so memory stays about one screen's worth at any resolution
+STATIC_MARGIN = 64  # extra pixels each way; a multiple of 4 so scanlines stay aligned
+
+def make_static_surface():
+    noise = rng.integers(0, 256, (WIDTH + STATIC_MARGIN, HEIGHT + STATIC_MARGIN, 3), dtype=np.uint8)
+    noise[:, ::4] = 0  # scanlines: every 4th row black
+    return pygame.surfarray.make_surface(noise).convert()
+
+static_surface = make_static_surface()
+
+# Per-frame random int streams
+static_xs = random_ints(0, STATIC_MARGIN)
+static_ys = random_ints(0, STATIC_MARGIN // 4)  # in scanline periods (4 px)
+scroll_offsets = random_ints(-20, 20)
+enemy_flickers = random_ints(-5, 5)
+enemy_jitters = random_ints(-10, 10)
+
 # Load sounds
 try:
     pygame.mixer.music.load("static_drone.wav")
@@ -57,19 +91,31 @@ jumpscare_timer = random.randint(300, 600)
 
 # Heartbeat effect (volume depends on distance)
 def heartbeat_volume(player_x, player_y, enemy_x, enemy_y):
-    dist = np.hypot(player_x - enemy_x, player_y - enemy_y)
+    dist = math.hypot(player_x - enemy_x, player_y - enemy_y)
     return max(0.1, min(1.0, 300 / (dist + 1)))
 
+# Enemy movement (smooth chase + erratic flicker), one simulation tick
+def step_enemy(ex, ey, px, py, speed):
+    if random.random() < 0.05:
+        ex += next(enemy_jitters)
+        ey += next(enemy_jitters)
+    if ex < px:
+        ex += speed
+    elif ex > px:
+        ex -= speed
+    if ey < py:
+        ey += speed
+    elif ey > py:
+        ey -= speed
+    return ex, ey
+
 # Draw VHS static
 def draw_static():
-    noise = np.random.randint(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
-    pygame.surfarray.blit_array(screen, noise.swapaxes(0,1))
-    # Add scanlines
-    for y in range(0, HEIGHT, 4):
-        pygame.draw.line(screen, (0,0,0), (0,y), (WIDTH, y), 1)
+    # Noise with scanlines already baked in
+    screen.blit(static_surface, (-next(static_xs), -4 * next(static_ys)))
     # Add flickering horizontal distort
     if random.random() < 0.05:
-        offset = random.randint(-20, 20)
+        offset = next(scroll_offsets)
         screen.scroll(dx=offset)
 
 # Flickering text
@@ -86,7 +132,7 @@ def draw_player(x, y):
 
 # Draw enemy with flicker/distortion
 def draw_enemy(x, y):
-    flicker = random.randint(-5,5)
+    flicker = next(enemy_flickers)
     pygame.draw.rect(screen, ENEMY_COLOR, (x+flicker, y+flicker, enemy_size, enemy_size))
 
 # Flashlight effect with smooth fade
@@ -138,8 +184,16 @@ def main_game():
     enemy_x, enemy_y = random.randint(0, WIDTH), random.randint(0, HEIGHT)
     jumpscare_timer = random.randint(300, 600)
     
+    # Collision rects are reused every frame; only their position changes
+    player_rect = pygame.Rect(0, 0, player_size, player_size)
+    enemy_rect = pygame.Rect(0, 0, enemy_size, enemy_size)
+
+    acc = 0.0
+    clock.tick()  # don't simulate the time spent before (re)starting
     running = True
     while running:
+        acc += min(clock.tick(FPS) / 1000.0, MAX_FRAME_DT)
+
         screen.fill(BLACK)
         draw_static()
         draw_text()
@@ -153,47 +207,41 @@ def main_game():
                 pygame.quit()
                 sys.exit()
 
-        # Player movement
+        # Fixed-step simulation, decoupled from the render rate
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] and player_x > 0:
-            player_x -= player_speed
-        if keys[pygame.K_RIGHT] and player_x < WIDTH - player_size:
-            player_x += player_speed
-        if keys[pygame.K_UP] and player_y > 0:
-            player_y -= player_speed
-        if keys[pygame.K_DOWN] and player_y < HEIGHT - player_size:
-            player_y += player_speed
-
-        # Enemy movement (smooth chase + erratic flicker)
-        if random.random() < 0.05:
-            enemy_x += random.randint(-10,10)
-            enemy_y += random.randint(-10,10)
-        if enemy_x < player_x:
-            enemy_x += enemy_speed
-        elif enemy_x > player_x:
-            enemy_x -= enemy_speed
-        if enemy_y < player_y:
-            enemy_y += enemy_speed
-        elif enemy_y > player_y:
-            enemy_y -= enemy_speed
+        while acc >= TICK_DT:
+            acc -= TICK_DT
+
+            # Player movement
+            if keys[pygame.K_LEFT] and player_x > 0:
+                player_x -= player_speed
+            if keys[pygame.K_RIGHT] and player_x < WIDTH - player_size:
+                player_x += player_speed
+            if keys[pygame.K_UP] and player_y > 0:
+                player_y -= player_speed
+            if keys[pygame.K_DOWN] and player_y < HEIGHT - player_size:
+                player_y += player_speed
+
+            enemy_x, enemy_y = step_enemy(enemy_x, enemy_y, player_x, player_y, enemy_speed)
+
+            jumpscare_timer -= 1
 
         draw_player(player_x, player_y)
         draw_enemy(enemy_x, enemy_y)
 
         # Collision check
-        player_rect = pygame.Rect(player_x, player_y, player_size, player_size)
-        enemy_rect = pygame.Rect(enemy_x, enemy_y, enemy_size, enemy_size)
+        player_rect.topleft = (player_x, player_y)
+        enemy_rect.topleft = (enemy_x, enemy_y)
         if player_rect.colliderect(enemy_rect):
             game_over_screen()
 
         # Random jumpscare
-        jumpscare_timer -= 1
         if jumpscare_timer <= 0:
             jumpscare()
             jumpscare_timer = random.randint(300, 600)
+            clock.tick()  # the jumpscare blocks; don't fast-forward through it
 
         pygame.display.flip()
-        clock.tick(30)
 
 # Start the game
 main_game()
@@ -1,32 +1,47 @@
 # file: story_game.py
 import json
 import os
+import sys
+from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional
 
 SAVE_FILE = "savegame.json"
 
+@dataclass(slots=True)
 class Choice:
-    def __init__(self, key: str, text: str, next_scene: str, effect: Optional[Callable[['GameState'], None]] = None, requires: Optional[Callable[['GameState'], bool]] = None):
-        self.key = key
-        self.text = text
-        self.next_scene = next_scene
-        self.effect = effect
-        self.requires = requires
+    key: str
+    text: str
+    next_scene: str
+    effect: Optional[Callable[['GameState'], None]] = None
+    requires: Optional[Callable[['GameState'], bool]] = None
 
+@dataclass(slots=True)
 class Scene:
-    def __init__(self, key: str, title: str, body: str, choices: List[Choice], on_enter: Optional[Callable[['GameState'], None]] = None):
-        self.key = key
-        self.title = title
-        self.body = body
-        self.choices = choices
-        self.on_enter = on_enter
+    key: str
+    title: str
+    body: str
+    choices: List[Choice]
+    on_enter: Optional[Callable[['GameState'], None]] = None
+    choice_map: Dict[str, Choice] = field(init=False, repr=False)
+    header: str = field(init=False, repr=False)
+    rendered: Optional[str] = field(init=False, repr=False)  # full frame text, None if any choice has requirements
+
+    def __post_init__(self):
+        # Index choices by key once so input dispatch is a single dict lookup
+        self.choice_map = {c.key: c for c in self.choices}
+        # Scene text never changes, so format it once; choices too unless they depend on state
+        self.header = f"== {self.title} ==\n{self.body}\n\n"
+        if any(c.requires for c in self.choices):
+            self.rendered = None
+        else:
+            self.rendered = self.header + "".join(f"[{c.key}] {c.text}\n" for c in self.choices)
 
+@dataclass(slots=True)
 class GameState:
-    def __init__(self):
-        self.flags: Dict[str, bool] = {}
-        self.meter: Dict[str, int] = {"comfort": 5}  # 0–10
-        self.scene_key: str = "intro"
-        self.player_name: str = "You"
+    flags: Dict[str, bool] = field(default_factory=dict)
+    meter: Dict[str, int] = field(default_factory=lambda: {"comfort": 5})  # 0–10
+    scene_key: str = "intro"
+    player_name: str = "You"
 
     def to_dict(self):
         return {
@@ -45,6 +60,12 @@ class GameState:
         gs.player_name = d.get("player_name", "You")
         return gs
 
+    def copy_from(self, other: 'GameState'):
+        self.flags = other.flags
+        self.meter = other.meter
+        self.scene_key = other.scene_key
+        self.player_name = other.player_name
+
 def clear():
     os.system("cls" if os.name == "nt" else "clear")
 
@@ -69,12 +90,46 @@ def adjust_comfort(delta: int):
         state.meter["comfort"] = max(0, min(10, state.meter["comfort"] + delta))
     return _fx
 
+def do_save(state: GameState):
+    save(state)
+    print("Saved.")
+
+def do_load(state: GameState):
+    loaded = load()
+    if loaded:
+        state.copy_from(loaded)
+    print("Loaded." if loaded else "No save found.")
+
+def do_show_comfort(state: GameState):
+    print(f"Comfort: {state.meter['comfort']}/10")
+
 def requires_flag(flag: str, value: bool = True):
     return lambda s: s.flags.get(flag, False) == value
 
 def requires_comfort_at_least(n: int):
     return lambda s: s.meter.get("comfort", 0) >= n
 
+# ----- Pseudo-scenes -----
+# Loop actions returned by handlers for next_scene values that aren't real scenes
+QUIT, REDRAW, STAY = range(3)
+
+def handle_quit(state: GameState, history: List[str]) -> int:
+    print("Goodbye!")
+    return QUIT
+
+def handle_back(state: GameState, history: List[str]) -> int:
+    # Go back to previous scene if available
+    if history:
+        state.scene_key = history.pop()
+        return REDRAW
+    print("No previous scene.")
+    return STAY
+
+SPECIAL_SCENES: Dict[str, Callable[[GameState, List[str]], int]] = {
+    "quit": handle_quit,
+    "back": handle_back,
+}
+
 # ----- Scenes -----
 def build_scenes() -> Dict[str, Scene]:
     scenes: Dict[str, Scene] = {}
@@ -194,9 +249,9 @@ def build_scenes() -> Dict[str, Scene]:
               "  [c] Check comfort meter\n"
               "  [b] Back to last scene\n"),
         choices=[
-            Choice("s", "Save game.", "menu", lambda s: (save(s), print("Saved."))),
-            Choice("l", "Load game.", "menu", lambda s: (loaded := load(), (s.__dict__.update(loaded.__dict__) if loaded else None, print("Loaded." if loaded else "No save found.")))),
-            Choice("c", "Show comfort meter.", "menu", lambda s: print(f"Comfort: {s.meter['comfort']}/10")),
+            Choice("s", "Save game.", "menu", do_save),
+            Choice("l", "Load game.", "menu", do_load),
+            Choice("c", "Show comfort meter.", "menu", do_show_comfort),
             Choice("b", "Back.", "back")
         ],
     )
@@ -215,54 +270,67 @@ def build_scenes() -> Dict[str, Scene]:
 
     return scenes
 
+# The scene graph doesn't depend on game state, so it is built once and shared by every run()
+_SCENES: Optional[Dict[str, Scene]] = None
+
+def get_scenes() -> Dict[str, Scene]:
+    global _SCENES
+    if _SCENES is None:
+        _SCENES = build_scenes()
+    return _SCENES
+
 def run():
     state = load() or GameState()
-    scenes = build_scenes()
+    scenes = get_scenes()
     history: List[str] = []
+    dirty = True  # scene changed: clear the screen, run on_enter and redraw
 
     while True:
-        clear()
         scene = scenes[state.scene_key]
-        if scene.on_enter:
-            scene.on_enter(state)
-
-        print(f"== {scene.title} ==")
-        print(scene.body)
-        print()
-
-        # Show valid choices considering requirements
-        valid_choices = []
-        for ch in scene.choices:
-            if ch.requires and not ch.requires(state):
-                continue
-            valid_choices.append(ch)
-            print(f"[{ch.key}] {ch.text}")
+        if dirty:
+            clear()
+            if scene.on_enter:
+                scene.on_enter(state)
+
+            if scene.rendered is not None:
+                # Static scene: every choice is always available, reuse the prebuilt index
+                sys.stdout.write(scene.rendered)
+                valid = scene.choice_map
+            else:
+                # Show valid choices considering requirements; one write for the whole frame
+                parts = [scene.header]
+                valid = {}
+                for ch in scene.choices:
+                    if ch.requires and not ch.requires(state):
+                        continue
+                    valid[ch.key] = ch
+                    parts.append(f"[{ch.key}] {ch.text}\n")
+                sys.stdout.write("".join(parts))
+            dirty = False
 
         # Special handling: "back" pseudo-scene
         choice_key = input("\nChoose: ").strip().lower()
-        chosen = next((c for c in valid_choices if c.key == choice_key), None)
-        if not chosen:
-            print("Invalid choice. Press Enter.")
-            input()
+        chosen = valid.get(choice_key)
+        if chosen is None:
+            # Nothing changed, so just ask again below the current scene
+            print("Invalid choice.")
             continue
 
         if chosen.effect:
             chosen.effect(state)
 
-        if chosen.next_scene == "quit":
-            print("Goodbye!")
-            break
-        elif chosen.next_scene == "back":
-            # Go back to previous scene if available
-            if history:
-                state.scene_key = history.pop()
-            else:
-                print("No previous scene. Press Enter.")
-                input()
-            continue
-        else:
+        handler = SPECIAL_SCENES.get(chosen.next_scene)
+        if handler is None:
+            # Common case: move on to a real scene
             history.append(state.scene_key)
             state.scene_key = chosen.next_scene
+            dirty = True
+            continue
+
+        action = handler(state, history)
+        if action == QUIT:
+            break
+        dirty = action == REDRAW
 
 if __name__ == "__main__":
     run()